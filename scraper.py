@@ -5,37 +5,208 @@ Extracts: names, images, birthdays, gift preferences, and schedules
 """
 
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+import lxml.etree
+import lxml.html
+from lxml.html import HtmlElement
 import json
 import time
+import random
 import re
+import threading
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library writer
+    orjson = None
 
 # Constants
 BASE_URL = "https://stardewvalleywiki.com"
 VILLAGERS_URL = f"{BASE_URL}/Villagers"
 REQUEST_DELAY = 0.5  # Be respectful to the wiki - wait between requests
+MAX_CONCURRENT_REQUESTS = 8  # Pages fetched in parallel
+CACHE_NAME = "sdv_wiki_cache"  # On-disk HTTP cache (sdv_wiki_cache.sqlite)
+CACHE_EXPIRE_AFTER = 24 * 3600  # Seconds before a cached page is refetched
+MAX_RETRIES = 5  # Attempts after the first for timeouts and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}  # Responses worth retrying
+CACHE_META_FILE = "cache_meta.json"  # ETag/Last-Modified of the pages behind villagers.json
+PARSER_VERSION = 1  # Bump whenever a parse_* change alters the saved villager data
 HEADERS = {
     "User-Agent": "StardewValleyCompanionApp/1.0 (Educational Project)"
 }
 
+SEASONS = ("Spring", "Summer", "Fall", "Winter")
+
 # Marriage candidates
 BACHELORS = ["Alex", "Elliott", "Harvey", "Sam", "Sebastian", "Shane"]
 BACHELORETTES = ["Abigail", "Emily", "Haley", "Leah", "Maru", "Penny"]
 MARRIAGE_CANDIDATES = set(BACHELORS + BACHELORETTES)
 
+# Birthday formats: "Season Day" (e.g., "Summer13") and "Day Season" (e.g., "13Fall")
+SEASON_DAY_RE = re.compile(r"(Spring|Summer|Fall|Winter)\s*(\d+)")
+DAY_SEASON_RE = re.compile(r"(\d+)\s*(Spring|Summer|Fall|Winter)")
+# Section links and categories that show up among gift items
+GIFT_BAN_RE = re.compile(r"universal|category|gift|villager", re.IGNORECASE)
 
-def make_request(url: str) -> Optional[BeautifulSoup]:
-    """Make a request to the wiki with rate limiting and error handling."""
-    try:
-        time.sleep(REQUEST_DELAY)
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        response.raise_for_status()
-        return BeautifulSoup(response.content, "lxml")
-    except requests.RequestException as e:
-        print(f"Error fetching {url}: {e}")
-        return None
+# The wiki serves UTF-8, so tell the parser instead of letting it detect it
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# XPath selectors for the wiki's page layout, compiled once and called on an
+# element (e.g. INFOBOX_SECTION_XPATH(infobox)) to get the matching list
+INFOBOX_SECTION_XPATH = lxml.etree.XPath(".//td[@id='infoboxsection']")
+INFOBOX_DETAIL_XPATH = lxml.etree.XPath("following-sibling::td[@id='infoboxdetail'][1]")
+HEADLINE_XPATH = lxml.etree.XPath(
+    ".//span[contains(concat(' ', normalize-space(@class), ' '), ' mw-headline ')]"
+)
+# Item links: anchors with a non-empty title that is not a File: link
+GIFT_LINK_XPATH = lxml.etree.XPath(".//a[@title != '' and not(starts-with(@title, 'File:'))]")
+# A schedule cell's own paragraphs and tables, in document order
+SCHEDULE_BLOCKS_XPATH = lxml.etree.XPath("./p | ./table")
+# A table's own rows, without descending into nested tables
+TABLE_ROWS_XPATH = lxml.etree.XPath("./tr | ./*[self::thead or self::tbody or self::tfoot]/tr")
+
+# Rate limiter state shared by all fetch threads
+_rate_limit_lock = threading.Lock()
+_last_request_time = 0.0
+
+
+def wait_for_rate_limit():
+    """
+    Block until at least REQUEST_DELAY has passed since the previous request
+    started. Only the remaining gap is slept, so time already spent elsewhere
+    (parsing, other requests in flight) counts towards the delay.
+    """
+    global _last_request_time
+    with _rate_limit_lock:
+        wait = REQUEST_DELAY - (time.monotonic() - _last_request_time)
+        if wait > 0:
+            time.sleep(wait)
+        _last_request_time = time.monotonic()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    Transport adapter that waits for the rate limiter before each request.
+    The cache answers hits before the adapter is reached, so only requests
+    that actually go to the wiki are throttled.
+    """
+    
+    def send(self, request, **kwargs):
+        wait_for_rate_limit()
+        return super().send(request, **kwargs)
+
+
+# Shared session, created on first use so importing the module (as the parse
+# worker processes do) doesn't open the on-disk cache
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session() -> requests_cache.CachedSession:
+    """
+    Create the session every page is fetched through. It reuses keep-alive
+    connections to the wiki and caches responses on disk for a day, so
+    re-runs mostly skip the network.
+    """
+    session = requests_cache.CachedSession(
+        CACHE_NAME,
+        backend="sqlite",
+        expire_after=CACHE_EXPIRE_AFTER,
+        stale_if_error=True
+    )
+    session.headers.update(HEADERS)
+    session.mount("https://", RateLimitedAdapter(
+        pool_connections=1,
+        pool_maxsize=16
+    ))
+    return session
+
+
+def get_session() -> requests_cache.CachedSession:
+    """Return the shared session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def make_request(url: str, validators: Optional[dict] = None) -> Optional[requests.Response]:
+    """
+    Fetch a wiki page with rate limiting and error handling.
+    If validators from a previous scrape are given, the request is made
+    conditional and a 304 Not Modified response is returned as-is.
+    """
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    
+    # Every attempt goes back through the rate-limited adapter, so retries
+    # keep the REQUEST_DELAY gap on top of their own backoff
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = get_session().get(url, headers=headers, timeout=30)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+        except (requests.Timeout, requests.ConnectionError, requests.HTTPError) as e:
+            failed = e.response if isinstance(e, requests.HTTPError) else None
+            if attempt == MAX_RETRIES or (failed is not None and failed.status_code not in RETRY_STATUSES):
+                print(f"Error fetching {url}: {e}")
+                return None
+            time.sleep(retry_delay(attempt, failed))
+        except requests.RequestException as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+
+def retry_delay(attempt: int, response: Optional[requests.Response] = None) -> float:
+    """
+    Exponential backoff with jitter before retrying a failed request, so
+    threads that failed together don't retry in lock-step. A longer
+    Retry-After (in seconds) from the wiki takes precedence.
+    """
+    delay = min(16, 0.5 * 2 ** attempt) + random.random() * 0.25
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    if retry_after.isdigit():
+        delay = max(delay, float(retry_after))
+    return delay
+
+
+def get_validators(response: requests.Response) -> dict:
+    """Get the ETag and Last-Modified validators of a page response."""
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified")
+    }
+
+
+def is_unchanged(response: requests.Response, validators: Optional[dict]) -> bool:
+    """
+    Check whether a page is the same version as when it was last parsed.
+    The wiki may answer 304, or the cache may hand back a response that
+    carries the same validators.
+    """
+    if response.status_code == 304:
+        return True
+    if not validators:
+        return False
+    
+    current = get_validators(response)
+    if validators.get("etag") and current["etag"]:
+        return current["etag"] == validators["etag"]
+    if validators.get("last_modified") and current["last_modified"]:
+        return current["last_modified"] == validators["last_modified"]
+    return False
 
 
 def get_villager_list() -> list[dict]:
@@ -67,48 +238,46 @@ def get_villager_list() -> list[dict]:
     return villagers
 
 
-def parse_birthday(soup: BeautifulSoup) -> Optional[dict]:
-    """Extract birthday from villager infobox."""
-    # The wiki uses id="infoboxtable" for the main infobox
-    infobox = soup.find("table", {"id": "infoboxtable"})
-    if not infobox:
-        return None
-    
-    # Look for the birthday row
-    for row in infobox.find_all("tr"):
-        section = row.find("td", {"id": "infoboxsection"})
-        if section and "Birthday" in section.get_text():
-            detail = row.find("td", {"id": "infoboxdetail"})
-            if detail:
-                birthday_text = detail.get_text(strip=True)
-                
-                # Try "Season Day" format first (e.g., "Summer13" or "Summer 13")
-                match = re.match(r"(Spring|Summer|Fall|Winter)\s*(\d+)", birthday_text)
-                if match:
-                    return {
-                        "season": match.group(1),
-                        "day": int(match.group(2))
-                    }
-                
-                # Try "Day Season" format (e.g., "13Fall" or "13 Fall")
-                match = re.match(r"(\d+)\s*(Spring|Summer|Fall|Winter)", birthday_text)
-                if match:
-                    return {
-                        "season": match.group(2),
-                        "day": int(match.group(1))
-                    }
+def get_text(element: HtmlElement, separator: str = "") -> str:
+    """Join the element's stripped text fragments, skipping empty ones."""
+    return separator.join(text.strip() for text in element.itertext() if text.strip())
+
+
+def next_sibling(element: HtmlElement) -> Optional[HtmlElement]:
+    """Return the next sibling element, skipping comments and other non-tags."""
+    sibling = element.getnext()
+    while sibling is not None and not isinstance(sibling.tag, str):
+        sibling = sibling.getnext()
+    return sibling
+
+
+def parse_birthday(detail: HtmlElement) -> Optional[dict]:
+    """Parse a birthday from the infobox Birthday cell."""
+    birthday_text = get_text(detail)
+    
+    # Try "Season Day" format first (e.g., "Summer13" or "Summer 13")
+    match = SEASON_DAY_RE.match(birthday_text)
+    if match:
+        return {
+            "season": match.group(1),
+            "day": int(match.group(2))
+        }
+    
+    # Try "Day Season" format (e.g., "13Fall" or "13 Fall")
+    match = DAY_SEASON_RE.match(birthday_text)
+    if match:
+        return {
+            "season": match.group(2),
+            "day": int(match.group(1))
+        }
     return None
 
 
-def parse_image_url(soup: BeautifulSoup) -> Optional[str]:
+def parse_image_url(infobox: HtmlElement) -> Optional[str]:
     """Extract the main villager portrait image URL."""
-    infobox = soup.find("table", {"id": "infoboxtable"})
-    if not infobox:
-        return None
-    
     # The portrait is usually the first image in the infobox
-    img = infobox.find("img")
-    if img and img.get("src"):
+    img = infobox.find(".//img")
+    if img is not None and img.get("src"):
         src = img.get("src")
         # Make sure it's an absolute URL
         if src.startswith("//"):
@@ -119,35 +288,57 @@ def parse_image_url(soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
-def parse_gift_preferences(soup: BeautifulSoup) -> dict:
-    """Extract all gift preferences (loved, liked, neutral, disliked, hated)."""
+def parse_infobox(infobox: Optional[HtmlElement]) -> tuple[Optional[dict], Optional[str], list]:
+    """
+    Extract the birthday, portrait image URL, and loved gifts from the
+    villager infobox in a single pass over its section labels.
+    """
+    birthday = None
+    loved = []
+    if infobox is None:
+        return birthday, None, loved
+    
+    seen = set()
+    # Each label cell is followed by its value cell in the same row
+    for section in INFOBOX_SECTION_XPATH(infobox):
+        label = section.text_content()
+        if "Birthday" in label:
+            if birthday:
+                continue
+            details = INFOBOX_DETAIL_XPATH(section)
+            if details:
+                birthday = parse_birthday(details[0])
+        
+        elif "Loved" in label:
+            details = INFOBOX_DETAIL_XPATH(section)
+            if details:
+                # Items are in nametemplate spans with links
+                for link in GIFT_LINK_XPATH(details[0]):
+                    item = link.get("title").strip()
+                    if item and item not in seen:
+                        seen.add(item)
+                        loved.append(item)
+    
+    return birthday, parse_image_url(infobox), loved
+
+
+def parse_gift_preferences(loved: list, content: Optional[HtmlElement]) -> dict:
+    """
+    Extract all gift preferences (loved, liked, neutral, disliked, hated).
+    Loved gifts start from the infobox list, which is always present.
+    """
     gifts = {
-        "loved": [],
+        "loved": list(loved),
         "liked": [],
         "neutral": [],
         "disliked": [],
         "hated": []
     }
-    
-    # First, try to get loved gifts from the infobox (always present there)
-    infobox = soup.find("table", {"id": "infoboxtable"})
-    if infobox:
-        for row in infobox.find_all("tr"):
-            section = row.find("td", {"id": "infoboxsection"})
-            if section and "Loved" in section.get_text():
-                detail = row.find("td", {"id": "infoboxdetail"})
-                if detail:
-                    # Items are in nametemplate spans with links
-                    for link in detail.find_all("a"):
-                        title = link.get("title")
-                        if title and not title.startswith("File:"):
-                            item = title.strip()
-                            if item and item not in gifts["loved"]:
-                                gifts["loved"].append(item)
+    # Items already added per category, for O(1) duplicate checks
+    seen = {category: set(items) for category, items in gifts.items()}
     
     # Now parse the Gifts section for all categories
-    content = soup.find("div", {"id": "mw-content-text"})
-    if not content:
+    if content is None:
         return gifts
     
     # Find gift category headings (h3 level: Love, Like, Neutral, Dislike, Hate)
@@ -159,120 +350,120 @@ def parse_gift_preferences(soup: BeautifulSoup) -> dict:
         "hate": "hated"
     }
     
-    for heading in content.find_all("h3"):
-        span = heading.find("span", {"class": "mw-headline"})
-        if not span:
+    for heading in content.iter("h3"):
+        spans = HEADLINE_XPATH(heading)
+        if not spans:
             continue
             
-        heading_text = span.get_text(strip=True).lower()
-        current_category = None
-        
-        for key, value in category_map.items():
-            if key == heading_text:
-                current_category = value
-                break
-        
-        if not current_category:
+        heading_text = get_text(spans[0]).lower()
+        current_category = category_map.get(heading_text)
+        if current_category is None:
             continue
         
         # Look for the items after this heading (usually in a div or table)
-        sibling = heading.find_next_sibling()
-        while sibling and sibling.name not in ["h2", "h3"]:
+        sibling = next_sibling(heading)
+        while sibling is not None and sibling.tag not in ["h2", "h3"]:
             # Parse items from nametemplate spans or links
-            for link in sibling.find_all("a"):
-                title = link.get("title")
-                if title and not title.startswith("File:"):
-                    item = title.strip()
-                    if item and item not in gifts[current_category]:
-                        # Filter out section links and categories
-                        if not any(x in item.lower() for x in ["universal", "category", "gift", "villager"]):
-                            gifts[current_category].append(item)
-            sibling = sibling.find_next_sibling()
+            for link in GIFT_LINK_XPATH(sibling):
+                item = link.get("title").strip()
+                if item and item not in seen[current_category]:
+                    # Filter out section links and categories
+                    if not GIFT_BAN_RE.search(item):
+                        seen[current_category].add(item)
+                        gifts[current_category].append(item)
+            sibling = next_sibling(sibling)
     
     return gifts
 
 
-def parse_schedule(soup: BeautifulSoup) -> dict:
+class ScheduleEntry(NamedTuple):
+    """
+    One row of a schedule. Kept as a tuple while scraping and written out
+    as {"time": ..., "location": ...} when the JSON is saved.
+    """
+    time: str
+    location: str
+
+
+def parse_schedule(content: Optional[HtmlElement]) -> dict:
     """Extract the full detailed schedule."""
     schedule = {}
     
-    content = soup.find("div", {"id": "mw-content-text"})
-    if not content:
+    if content is None:
         return schedule
     
     # Find the "Schedule" section
     schedule_section = None
-    for heading in content.find_all("h2"):
-        span = heading.find("span", {"class": "mw-headline"})
-        if span and "Schedule" in span.get_text():
+    for heading in content.iter("h2"):
+        spans = HEADLINE_XPATH(heading)
+        if spans and "Schedule" in spans[0].text_content():
             schedule_section = heading
             break
     
-    if not schedule_section:
+    if schedule_section is None:
         return schedule
     
     # Look for collapsible tables (one per season)
     # These tables have class "mw-collapsible"
-    sibling = schedule_section.find_next_sibling()
+    sibling = next_sibling(schedule_section)
     
-    while sibling and sibling.name != "h2":
+    while sibling is not None and sibling.tag != "h2":
         # Check for collapsible season tables
-        if sibling.name == "table" and "mw-collapsible" in sibling.get("class", []):
+        if sibling.tag == "table" and "mw-collapsible" in sibling.classes:
             # Get the season name from the header
-            header = sibling.find("th")
-            if header:
-                season_link = header.find("a")
-                season_name = season_link.get_text(strip=True) if season_link else header.get_text(strip=True)
+            header = sibling.find(".//th")
+            if header is not None:
+                season_link = header.find(".//a")
+                season_name = get_text(season_link) if season_link is not None else get_text(header)
                 
                 # Parse all schedule variants within this season
                 schedule[season_name] = parse_season_schedules(sibling)
         
-        sibling = sibling.find_next_sibling()
+        sibling = next_sibling(sibling)
     
     return schedule
 
 
-def parse_season_schedules(season_table: BeautifulSoup) -> list:
+def parse_season_schedules(season_table: HtmlElement) -> list:
     """Parse all schedule variants within a season's collapsible table."""
     schedules = []
     
     # Find all wikitables within the season table (each is a schedule variant)
     # Also find the <b> tags that label each schedule
-    content_cell = season_table.find("td")
-    if not content_cell:
+    content_cell = season_table.find(".//td")
+    if content_cell is None:
         return schedules
     
     current_label = "Regular"
     
-    # Iterate through the content
-    for element in content_cell.children:
-        if element.name == "p":
+    # Walk the cell's paragraphs and tables once, in document order
+    for element in SCHEDULE_BLOCKS_XPATH(content_cell):
+        if element.tag == "p":
             # Check for bold text indicating schedule name
-            bold = element.find("b")
-            if bold:
-                current_label = bold.get_text(strip=True)
+            bold = element.find(".//b")
+            if bold is not None:
+                current_label = get_text(bold)
         
-        elif element.name == "table" and "wikitable" in element.get("class", []):
+        elif "wikitable" in element.classes:
             # Parse this schedule table
             schedule_data = {
                 "name": current_label,
                 "entries": []
             }
             
-            rows = element.find_all("tr")
+            add_entry = schedule_data["entries"].append
+            rows = TABLE_ROWS_XPATH(element)
             for row in rows:
                 # Skip header row
-                if row.find("th"):
+                if row.find("th") is not None:
                     continue
                 
-                tds = row.find_all("td")
+                # Only the row's own cells, not cells of nested tables
+                tds = row.findall("td")
                 if len(tds) >= 2:
-                    time = tds[0].get_text(strip=True)
-                    location = tds[1].get_text(" ", strip=True)
-                    schedule_data["entries"].append({
-                        "time": time,
-                        "location": location
-                    })
+                    time_str = get_text(tds[0])
+                    location = get_text(tds[1], " ")
+                    add_entry(ScheduleEntry(time_str, location))
             
             if schedule_data["entries"]:
                 schedules.append(schedule_data)
@@ -280,21 +471,33 @@ def parse_season_schedules(season_table: BeautifulSoup) -> list:
     return schedules
 
 
-def scrape_villager_details(name: str, url: str) -> Optional[dict]:
-    """Scrape all details for a single villager."""
-    print(f"  Scraping {name}...")
-    soup = make_request(url)
-    if not soup:
-        return None
+def parse_villager(name: str, url: str, html: bytes) -> dict:
+    """
+    Parse all details for a single villager from their page's HTML.
+    Runs in a worker process, so it only takes and returns plain data.
+    """
+    try:
+        tree = lxml.html.fromstring(html, parser=HTML_PARSER)
+    except lxml.etree.ParserError as e:
+        # lxml's error carries an unpicklable error log, so it can't be sent
+        # back from the worker process as-is
+        raise ValueError(f"could not parse page ({e})") from None
+    
+    # Look up the shared page sections once and hand them to each parser
+    # The wiki uses id="infoboxtable" for the main infobox
+    infobox = tree.find(".//table[@id='infoboxtable']")
+    content = tree.find(".//div[@id='mw-content-text']")
+    
+    birthday, image_url, loved = parse_infobox(infobox)
     
     villager = {
         "name": name,
         "url": url,
-        "image_url": parse_image_url(soup),
-        "birthday": parse_birthday(soup),
+        "image_url": image_url,
+        "birthday": birthday,
         "marriageable": name in MARRIAGE_CANDIDATES,
-        "gifts": parse_gift_preferences(soup),
-        "schedule": parse_schedule(soup)
+        "gifts": parse_gift_preferences(loved, content),
+        "schedule": parse_schedule(content)
     }
     
     return villager
@@ -302,25 +505,58 @@ def scrape_villager_details(name: str, url: str) -> Optional[dict]:
 
 def build_birthday_index(villagers: dict) -> dict:
     """Create a lookup index for birthdays by season and day."""
-    birthdays = {
-        "Spring": {},
-        "Summer": {},
-        "Fall": {},
-        "Winter": {}
-    }
-    
+    birthdays = defaultdict(dict)
     for name, data in villagers.items():
-        if data.get("birthday"):
-            season = data["birthday"]["season"]
-            day = str(data["birthday"]["day"])
-            if season in birthdays:
-                birthdays[season][day] = name
+        birthday = data.get("birthday")
+        if birthday:
+            birthdays[birthday["season"]][str(birthday["day"])] = name
     
-    return birthdays
+    return {season: birthdays.get(season, {}) for season in SEASONS}
 
 
-def scrape_all_villagers() -> dict:
-    """Main function to scrape all villager data."""
+def load_previous_scrape(filename: str = "villagers.json",
+                         meta_filename: str = CACHE_META_FILE) -> tuple[dict, dict]:
+    """
+    Load the villagers from the last saved scrape and the validators of the
+    pages they were parsed from. Returns empty dicts if either is missing,
+    or if the data was produced by a different PARSER_VERSION.
+    """
+    try:
+        with open(filename, encoding="utf-8") as f:
+            villagers = json.load(f).get("villagers", {})
+        with open(meta_filename, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}, {}
+    
+    # Saved data from another parser version has to be parsed again
+    if not isinstance(meta, dict) or meta.get("parser_version") != PARSER_VERSION:
+        return {}, {}
+    
+    validators = meta.get("pages", {})
+    
+    # Only pages whose parsed data is still on hand can be skipped
+    known_urls = {v.get("url") for v in villagers.values()}
+    validators = {url: page for url, page in validators.items() if url in known_urls}
+    return villagers, validators
+
+
+def parse_pool_context():
+    """
+    Multiprocessing context for the parse workers. Forking while the fetch
+    threads run could copy a lock held mid-request into the child, so use
+    a fork server where the platform has one (Windows already spawns).
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return None
+
+
+def scrape_all_villagers() -> tuple[dict, dict]:
+    """
+    Main function to scrape all villager data.
+    Returns the output data and the validators of the pages it was built from.
+    """
     print("=" * 50)
     print("Stardew Valley Villager Scraper")
     print("=" * 50)
@@ -330,17 +566,52 @@ def scrape_all_villagers() -> dict:
     
     if not villager_list:
         print("No villagers found!")
-        return {}
+        return {}, {}
     
     print(f"Scraping {len(villager_list)} villagers...")
     
-    # Scrape each villager's details
-    villagers = {}
-    for i, v in enumerate(villager_list, 1):
-        print(f"[{i}/{len(villager_list)}]", end="")
-        details = scrape_villager_details(v["name"], v["url"])
-        if details:
-            villagers[v["name"]] = details
+    # Pages that haven't changed since the last saved scrape reuse its data
+    previous, previous_validators = load_previous_scrape()
+    
+    # Fetch pages on a thread pool and hand each one to a process pool for
+    # parsing as soon as it arrives, so parsing overlaps with the network.
+    parsed = {}
+    page_validators = {}
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as fetch_pool, \
+            ProcessPoolExecutor(mp_context=parse_pool_context()) as parse_pool:
+        fetches = {
+            fetch_pool.submit(make_request, v["url"], previous_validators.get(v["url"])): v
+            for v in villager_list
+        }
+        parses = {}
+        for i, future in enumerate(as_completed(fetches), 1):
+            v = fetches[future]
+            response = future.result()
+            if response is None:
+                continue
+            
+            validators = previous_validators.get(v["url"])
+            if is_unchanged(response, validators) and v["name"] in previous:
+                print(f"[{i}/{len(villager_list)}]  {v['name']} unchanged, reusing saved data")
+                parsed[v["name"]] = previous[v["name"]]
+                page_validators[v["url"]] = validators
+                continue
+            
+            print(f"[{i}/{len(villager_list)}]  Parsing {v['name']}...")
+            page_validators[v["url"]] = get_validators(response)
+            parses[parse_pool.submit(parse_villager, v["name"], v["url"], response.content)] = v["name"]
+        
+        for future in as_completed(parses):
+            name = parses[future]
+            try:
+                parsed[name] = future.result()
+            except Exception as e:
+                # e.g. lxml rejects an empty page; skip it like a failed fetch
+                print(f"Error parsing {name}: {e}")
+    
+    # Keep the output in villager list order regardless of completion order
+    villagers = {v["name"]: parsed[v["name"]] for v in villager_list if v["name"] in parsed}
+    validators = {v["url"]: page_validators[v["url"]] for v in villager_list if v["name"] in parsed}
     
     # Build the final output structure
     output = {
@@ -354,22 +625,60 @@ def scrape_all_villagers() -> dict:
         "birthdays_by_date": build_birthday_index(villagers)
     }
     
-    return output
+    return output, validators
+
+
+def json_default(obj):
+    """Serialize types orjson doesn't handle natively."""
+    if isinstance(obj, ScheduleEntry):
+        return obj._asdict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def expand_schedule_entries(obj):
+    """
+    Recursively replace ScheduleEntry tuples with dicts. The json module
+    writes tuples as lists without consulting a default hook.
+    """
+    if isinstance(obj, ScheduleEntry):
+        return obj._asdict()
+    if isinstance(obj, dict):
+        return {key: expand_schedule_entries(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [expand_schedule_entries(value) for value in obj]
+    return obj
 
 
 def save_to_json(data: dict, filename: str = "villagers.json"):
     """Save the scraped data to a JSON file."""
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson:
+        # orjson produces UTF-8 bytes in the same layout as json.dump below
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, default=json_default, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(expand_schedule_entries(data), f, indent=2, ensure_ascii=False)
     print(f"\nData saved to {filename}")
 
 
+def save_cache_meta(validators: dict, filename: str = CACHE_META_FILE):
+    """Save the validators of the pages behind the saved villager data."""
+    meta = {
+        "parser_version": PARSER_VERSION,
+        "pages": validators
+    }
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+
 def main():
     """Main entry point."""
-    data = scrape_all_villagers()
+    with get_session():
+        data, validators = scrape_all_villagers()
     
     if data and data.get("villagers"):
         save_to_json(data)
+        save_cache_meta(validators)
         print(f"\nSuccessfully scraped {len(data['villagers'])} villagers!")
         print("\nSample villager data structure:")
         # Show a sample of the first villager